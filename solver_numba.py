@@ -0,0 +1,105 @@
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+from numba import njit
+
+Board = List[List[int]]
+
+ALL_DIGITS_MASK = 0x1FF
+
+# 512-entry popcount table; also used to recover a digit from its mask via
+# popcount(m - 1) + 1, since int.bit_length is unavailable in nopython mode.
+_POPCOUNT = np.array([bin(i).count("1") for i in range(512)], dtype=np.uint8)
+
+
+@njit(cache=True)
+def _solve(board: np.ndarray, rows: np.ndarray, cols: np.ndarray,
+           boxes: np.ndarray, popcount: np.ndarray) -> bool:
+    """Iterative MRV backtracking over a flat uint8[81] board.
+
+    rows/cols/boxes are 9-bit digit masks. Mutates board in place and
+    returns True when a full solution is reached."""
+    cells = np.empty(81, dtype=np.int32)
+    cand_left = np.empty(81, dtype=np.uint16)
+    depth = 0
+    need_select = True
+    while True:
+        if need_select:
+            best = -1
+            best_cand = 0
+            best_count = 10
+            for i in range(81):
+                if board[i] == 0:
+                    r = i // 9
+                    c = i % 9
+                    b = (r // 3) * 3 + c // 3
+                    cand = (~(rows[r] | cols[c] | boxes[b])) & ALL_DIGITS_MASK
+                    n = popcount[cand]
+                    if n < best_count:
+                        best = i
+                        best_cand = cand
+                        best_count = n
+                        if n <= 1:
+                            break
+            if best < 0:
+                return True
+            cells[depth] = best
+            cand_left[depth] = best_cand
+            need_select = False
+        cand = cand_left[depth]
+        if cand == 0:
+            if depth == 0:
+                return False
+            depth -= 1
+            i = cells[depth]
+            v = board[i]
+            m = 1 << (v - 1)
+            r = i // 9
+            c = i % 9
+            b = (r // 3) * 3 + c // 3
+            rows[r] ^= m
+            cols[c] ^= m
+            boxes[b] ^= m
+            board[i] = 0
+            continue
+        m = cand & (-cand)
+        cand_left[depth] = cand ^ m
+        i = cells[depth]
+        r = i // 9
+        c = i % 9
+        b = (r // 3) * 3 + c // 3
+        board[i] = popcount[m - 1] + 1
+        rows[r] |= m
+        cols[c] |= m
+        boxes[b] |= m
+        depth += 1
+        need_select = True
+
+
+def solve(board: Board) -> Optional[Board]:
+    """Solve a 9x9 board with the JIT kernel; returns a new Board or None.
+
+    Produces no per-step move log, so callers that need one must use the
+    pure-Python solvers in sudAug1925."""
+    flat = np.asarray(board, dtype=np.uint8).ravel().copy()
+    rows = np.zeros(9, dtype=np.uint16)
+    cols = np.zeros(9, dtype=np.uint16)
+    boxes = np.zeros(9, dtype=np.uint16)
+    for i in range(81):
+        v = flat[i]
+        if v == 0:
+            continue
+        r, c = i // 9, i % 9
+        b = (r // 3) * 3 + c // 3
+        m = 1 << (int(v) - 1)
+        if (rows[r] | cols[c] | boxes[b]) & m:
+            return None
+        rows[r] |= m
+        cols[c] |= m
+        boxes[b] |= m
+    if not _solve(flat, rows, cols, boxes, _POPCOUNT):
+        return None
+    return [[int(flat[r * 9 + c]) for c in range(9)] for r in range(9)]
@@ -0,0 +1,590 @@
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
+from collections import deque
+from typing import List, Tuple, Optional
+import random
+import threading
+import time
+
+from sudAug1925 import (Board, HIGHLIGHT, SudokuLogic,
+                        EASY_PUZZLES, MEDIUM_PUZZLES, HARD_PUZZLES)
+
+# Solutions for the built-in puzzles, computed once at import (keyed by list
+# identity) so Restart never pays for a solve. Unsolvable entries map to None.
+_SOLVED = {id(p): SudokuLogic.solve_fast(p)
+           for pool in (EASY_PUZZLES, MEDIUM_PUZZLES, HARD_PUZZLES)
+           for p in pool}
+
+
+class SudokuApp(tk.Tk):
+    def __init__(self) -> None:
+        super().__init__()
+        self.title("Sudoku — Tkinter")
+        self.resizable(False, False)
+
+        self.board_vars: List[List[tk.StringVar]] = [[tk.StringVar() for _ in range(9)] for _ in range(9)]
+        self.entries: List[List[tk.Entry]] = [[None for _ in range(9)] for _ in range(9)]  # type: ignore
+        self.given_mask: List[List[bool]] = [[False]*9 for _ in range(9)]
+        self.base_colors: List[List[str]] = [["white"]*9 for _ in range(9)]
+        # Last background actually pushed to each Entry; None forces a repaint.
+        self._last_paint: List[List[Optional[str]]] = [[None]*9 for _ in range(9)]
+        self.current_puzzle: Board = [[0]*9 for _ in range(9)]
+        self.current_solution: Optional[Board] = None
+
+        self.moves_count = 0
+        self.hints_used = 0
+        self.user_puzzles: List[Tuple[Board, Board]] = []
+        self._user_values: dict = {}
+
+        self.difficulty_var = tk.StringVar(value="Easy")
+        self.updating = False
+        self._solving = False
+
+        self.timer_seconds_total = 0
+        self.timer_seconds_left = 0
+        self.timer_running = False
+        self.timer_job: Optional[str] = None
+
+        self.font_given = tkfont.Font(family="Segoe UI", size=14, weight="bold")
+        self.font_user = tkfont.Font(family="Segoe UI", size=14, slant="italic")
+        self.font_normal = tkfont.Font(family="Segoe UI", size=14)
+
+        self._build_layout()
+        # Fixed: load an initial puzzle via the existing restart method
+        self._restart_puzzle()
+
+    def _build_layout(self) -> None:
+        main = ttk.Frame(self, padding=10)
+        main.grid(row=0, column=0)
+
+        grid_frame = ttk.Frame(main, padding=5, borderwidth=2, relief="groove")
+        grid_frame.grid(row=0, column=0, sticky="n")
+        self._build_grid(grid_frame)
+
+        side = ttk.Frame(main, padding=(10, 0))
+        side.grid(row=0, column=1, sticky="n")
+
+        diff_row = ttk.Frame(side)
+        diff_row.pack(anchor="w", pady=(0, 6))
+        ttk.Label(diff_row, text="Difficulty:").pack(side="left", padx=(0, 6))
+        ttk.OptionMenu(diff_row, self.difficulty_var, self.difficulty_var.get(),
+                       "Easy", "Medium", "Hard", "User Provided",
+                       command=lambda _=None: self._on_difficulty_change()).pack(side="left")
+
+        # Every button except Restart goes into a flat registry so the
+        # enable/disable passes don't have to walk the widget tree.
+        self._toggleable_buttons: List[ttk.Button] = []
+
+        def make_button(parent: tk.Widget, text: str, command) -> ttk.Button:
+            btn = ttk.Button(parent, text=text, command=command)
+            self._toggleable_buttons.append(btn)
+            return btn
+
+        btn_row1 = ttk.Frame(side)
+        btn_row1.pack(fill="x", pady=4)
+        self._restart_btn = ttk.Button(btn_row1, text="Restart Puzzle", command=self._restart_puzzle)
+        self._restart_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        make_button(btn_row1, "Clear Puzzle", self._clear_puzzle).pack(side="left", fill="x", expand=True)
+
+        btn_row2 = ttk.Frame(side)
+        btn_row2.pack(fill="x", pady=4)
+        make_button(btn_row2, "Hint", self._hint).pack(side="left", fill="x", expand=True, padx=(0, 5))
+        make_button(btn_row2, "Solve Puzzle", self._solve_puzzle_interactive).pack(side="left", fill="x", expand=True)
+
+        timer_box = ttk.LabelFrame(side, text="Timer")
+        timer_box.pack(fill="x", pady=8)
+        self.timer_label = ttk.Label(timer_box, text="00:00", font=("Segoe UI", 14))
+        self.timer_label.pack(side="left", padx=(6, 6), pady=6)
+        make_button(timer_box, "Set Countdown", self._set_timer_dialog).pack(side="left", padx=(0, 4))
+        make_button(timer_box, "Stop", self._stop_timer).pack(side="left")
+
+        user_box = ttk.LabelFrame(side, text="User Provided")
+        user_box.pack(fill="x", pady=8)
+        make_button(user_box, "Save as User Puzzle", self._save_user_puzzle).pack(fill="x", padx=6, pady=3)
+        make_button(user_box, "Verify User Solution", self._verify_user_solution).pack(fill="x", padx=6, pady=3)
+
+        stats = ttk.LabelFrame(side, text="Stats")
+        stats.pack(fill="x", pady=8)
+        self.moves_label = ttk.Label(stats, text="Moves: 0")
+        self.moves_label.pack(anchor="w", padx=6, pady=(6, 0))
+        self.hints_label = ttk.Label(stats, text="Hints used: 0")
+        self.hints_label.pack(anchor="w", padx=6, pady=(0, 6))
+
+        log_box = ttk.LabelFrame(side, text="Solver Moves")
+        log_box.pack(fill="both", expand=True, pady=8)
+        self.moves_list = tk.Listbox(log_box, height=18, width=42)
+        self.moves_list.pack(fill="both", expand=True, padx=6, pady=6)
+
+    def _build_grid(self, parent: tk.Widget) -> None:
+        self.cell_frames: List[List[ttk.Frame]] = [[None for _ in range(9)] for _ in range(9)]  # type: ignore
+        self._cell_index: dict = {}
+        self._hover_set: frozenset = frozenset()
+        self._hover_clear_job: Optional[str] = None
+        self.bind_class("SudokuCell", "<Enter>", self._on_cell_enter)
+        self.bind_class("SudokuCell", "<FocusIn>", self._on_cell_enter)
+        self.bind_class("SudokuCell", "<Leave>", self._on_cell_leave)
+        self.bind_class("SudokuCell", "<FocusOut>", self._on_cell_leave)
+        for br in range(3):
+            for bc in range(3):
+                box = ttk.Frame(parent, padding=3, borderwidth=2, relief="ridge")
+                box.grid(row=br, column=bc, padx=2, pady=2)
+                for i in range(3):
+                    for j in range(3):
+                        r, c = br*3 + i, bc*3 + j
+                        cell_frame = ttk.Frame(box, padding=1)
+                        cell_frame.grid(row=i, column=j, padx=1, pady=1)
+                        e = tk.Entry(cell_frame, width=2, justify="center",
+                                     font=self.font_user, relief="flat")
+                        e.grid(row=0, column=0, ipadx=6, ipady=6)
+                        vcmd = (self.register(self._validate_digit), "%P")
+                        e.configure(validate="key", validatecommand=vcmd)
+                        # All cells share the four class-level hover/focus
+                        # bindings registered below via this bindtag.
+                        e.bindtags(("SudokuCell",) + e.bindtags())
+                        self._cell_index[e] = r * 9 + c
+                        var = self.board_vars[r][c]
+                        var.trace_add("write", lambda *_args, rr=r, cc=c: self._on_cell_write(rr, cc))
+                        e.configure(textvariable=var)
+                        self.entries[r][c] = e
+                        self.cell_frames[r][c] = ttk.Frame(box)
+
+    def _get_board(self) -> Board:
+        board: Board = [[0]*9 for _ in range(9)]
+        for r in range(9):
+            for c in range(9):
+                s = self.board_vars[r][c].get().strip()
+                board[r][c] = int(s) if s.isdigit() else 0
+        return board
+
+    def _set_board(self, board: Board, as_given: bool) -> None:
+        # Only touch Tk for cells whose value or given-state actually changed;
+        # each .set()/.configure() is a Tcl round-trip.
+        self.updating = True
+        try:
+            for r in range(9):
+                for c in range(9):
+                    v = board[r][c]
+                    new_text = "" if v == 0 else str(v)
+                    var = self.board_vars[r][c]
+                    if var.get() != new_text:
+                        var.set(new_text)
+                    new_given = as_given and v != 0
+                    if new_given != self.given_mask[r][c]:
+                        e = self.entries[r][c]
+                        if new_given:
+                            e.configure(state="readonly", font=self.font_given, fg="black")
+                        else:
+                            e.configure(state="normal", font=self.font_user, fg="blue")
+                        self.given_mask[r][c] = new_given
+                        # given/user cells use different background options
+                        self._last_paint[r][c] = None
+                    self.base_colors[r][c] = "white"
+            self._user_values = {(r, c): board[r][c]
+                                 for r in range(9) for c in range(9)
+                                 if board[r][c] != 0 and not self.given_mask[r][c]}
+            self._clear_hint_colors()
+            self.update_idletasks()
+        finally:
+            self.updating = False
+
+    def _clear_hint_colors(self) -> None:
+        for r in range(9):
+            for c in range(9):
+                base = self.base_colors[r][c]
+                if self._last_paint[r][c] == base:
+                    continue
+                e = self.entries[r][c]
+                if self.given_mask[r][c]:
+                    e.configure(readonlybackground=base)
+                else:
+                    e.configure(background=base)
+                self._last_paint[r][c] = base
+
+    def _validate_digit(self, proposed: str) -> bool:
+        if proposed == "":
+            return True
+        if len(proposed) > 1:
+            return False
+        return proposed in "123456789"
+
+    def _on_cell_write(self, r: int, c: int) -> None:
+        if self.updating or self.given_mask[r][c]:
+            return
+        s = self.board_vars[r][c].get().strip()
+        if s.isdigit() and s != "0":
+            self._user_values[(r, c)] = int(s)
+        else:
+            self._user_values.pop((r, c), None)
+        self.moves_count += 1
+        self.moves_label.config(text=f"Moves: {self.moves_count}")
+        e = self.entries[r][c]
+        e.configure(state="normal", font=self.font_user, fg="blue")
+
+    def _paint_cell(self, i: int, color: str) -> None:
+        r, c = divmod(i, 9)
+        e = self.entries[r][c]
+        if self.given_mask[r][c]:
+            e.configure(readonlybackground=color)
+        else:
+            e.configure(background=color)
+
+    def _apply_hover(self, new: frozenset) -> None:
+        # Repaint only the cells entering or leaving the highlighted set.
+        old = self._hover_set
+        if new == old:
+            return
+        for i in old - new:
+            r, c = divmod(i, 9)
+            self._paint_cell(i, self.base_colors[r][c])
+        for i in new - old:
+            self._paint_cell(i, "#E6F3FF")
+        self._hover_set = new
+
+    def _on_cell_enter(self, event: tk.Event) -> None:
+        if self._hover_clear_job is not None:
+            self.after_cancel(self._hover_clear_job)
+            self._hover_clear_job = None
+        i = self._cell_index.get(event.widget)
+        if i is not None:
+            self._apply_hover(HIGHLIGHT[i])
+
+    def _on_cell_leave(self, _event: tk.Event) -> None:
+        # Deferred so moving straight into a peer cell repaints only the
+        # delta instead of clearing and redrawing all 21 cells.
+        if self._hover_clear_job is None:
+            self._hover_clear_job = self.after(30, self._clear_hover)
+
+    def _clear_hover(self) -> None:
+        self._hover_clear_job = None
+        self._apply_hover(frozenset())
+
+    def _on_difficulty_change(self) -> None:
+        messagebox.showinfo("Difficulty Changed",
+                            "Difficulty updated. Click 'Restart Puzzle' to load a new one.")
+
+    def _restart_puzzle(self) -> None:
+        diff = self.difficulty_var.get()
+        if diff == "User Provided":
+            if not self.user_puzzles:
+                messagebox.showwarning("No User Puzzles", "Save a user puzzle first.")
+                return
+            # The solution was validated and stored when the puzzle was saved.
+            src, solution = random.choice(self.user_puzzles)
+        else:
+            if diff == "Medium":
+                pool = MEDIUM_PUZZLES
+            elif diff == "Hard":
+                pool = HARD_PUZZLES
+            else:
+                pool = EASY_PUZZLES
+            src = random.choice(pool)
+            solution = _SOLVED[id(src)]
+
+        self.current_puzzle = SudokuLogic.deep_copy(src)
+        self._set_board(self.current_puzzle, as_given=True)
+        self.moves_count = 0
+        self.hints_used = 0
+        self.moves_label.config(text="Moves: 0")
+        self.hints_label.config(text="Hints used: 0")
+        self.moves_list.delete(0, tk.END)
+        self._enable_all_controls()
+        self._stop_timer(reset_label=True)
+        self.current_solution = solution
+
+    def _compute_solution(self, puzzle: Board) -> Optional[Board]:
+        return SudokuLogic.solve_fast(puzzle)
+
+    def _clear_puzzle(self) -> None:
+        self.updating = True
+        try:
+            for r in range(9):
+                for c in range(9):
+                    if not self.given_mask[r][c]:
+                        if self.board_vars[r][c].get():
+                            self.board_vars[r][c].set("")
+                        self.base_colors[r][c] = "white"
+            self._user_values.clear()
+            self._clear_hint_colors()
+        finally:
+            self.updating = False
+
+    def _hint(self) -> None:
+        # _restart_puzzle caches the solution for the loaded puzzle; it is
+        # only None when the puzzle itself has no solution.
+        if self.current_solution is None:
+            messagebox.showerror("No Solution", "Cannot compute a solution to compare with.")
+            return
+
+        self.hints_used += 1
+        self.hints_label.config(text=f"Hints used: {self.hints_used}")
+
+        for r in range(9):
+            for c in range(9):
+                if self.given_mask[r][c]:
+                    self.base_colors[r][c] = "white"
+                else:
+                    v = self._user_values.get((r, c), 0)
+                    if v == 0:
+                        self.base_colors[r][c] = "white"
+                    elif v == self.current_solution[r][c]:
+                        self.base_colors[r][c] = "#FFF59D"
+                    else:
+                        self.base_colors[r][c] = "#FFCDD2"
+        self._clear_hint_colors()
+
+    def _solve_puzzle_interactive(self) -> None:
+        if not messagebox.askyesno("Solve Puzzle?", "Are you sure you want to reveal the solution?"):
+            return
+        algo = self._ask_algorithm()
+        if not algo:
+            return
+        self._run_solver_and_render(algo, disable_after=True)
+
+    def _run_solver_and_render(self, algo: str, disable_after: bool) -> None:
+        # Solve on a worker thread so the event loop (timer, repaints) keeps
+        # running; the result is marshalled back onto the Tk thread via after.
+        if self._solving:
+            return
+        self._solving = True
+        board = self._get_board()
+        # Lock the controls while the worker runs so a click on Restart/Hint/
+        # Clear can't swap in a new puzzle that the stale result then clobbers.
+        for b in self._toggleable_buttons:
+            b.configure(state="disabled")
+        self._restart_btn.configure(state="disabled")
+
+        def work() -> None:
+            moves: List[str] = deque()  # type: ignore[assignment]
+            start = time.time()
+            if algo == "brute":
+                solved = SudokuLogic.solve_bruteforce(board, moves)
+            else:
+                solved = SudokuLogic.solve_backtracking_propagation(board, moves)
+            elapsed = time.time() - start
+            self.after(0, lambda: self._render_solver_result(
+                solved, moves, elapsed, algo, disable_after))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _render_solver_result(self, solved: Optional[Board], moves: List[str],
+                              elapsed: float, algo: str, disable_after: bool) -> None:
+        self._solving = False
+        for b in self._toggleable_buttons:
+            b.configure(state="normal")
+        self._restart_btn.configure(state="normal")
+        self.moves_list.delete(0, tk.END)
+        if solved is None:
+            self.moves_list.insert(tk.END, "No solution found.")
+            messagebox.showerror("Unsolvable", "No solution could be found.")
+            return
+
+        self._set_board(solved, as_given=True)
+        self.current_solution = solved
+
+        # One Tcl round-trip for the whole log instead of one per move.
+        self.moves_list.insert(tk.END,
+                               f"[{algo.upper()}] Solved in {len(moves)} steps, {elapsed:.3f}s",
+                               *moves)
+
+        if disable_after:
+            self._enable_only_restart()
+
+    def _ask_algorithm(self) -> Optional[str]:
+        dlg = tk.Toplevel(self)
+        dlg.title("Choose Algorithm")
+        dlg.resizable(False, False)
+        ttk.Label(dlg, text="Select solving algorithm:").pack(padx=12, pady=(12, 6))
+        algo_var = tk.StringVar(value="brute")
+
+        row = ttk.Frame(dlg)
+        row.pack(padx=12, pady=6, fill="x")
+        ttk.Radiobutton(row, text="Brute Force", variable=algo_var, value="brute").pack(anchor="w")
+        ttk.Radiobutton(row, text="Backtracking + Propagation", variable=algo_var, value="prop").pack(anchor="w")
+
+        btns = ttk.Frame(dlg)
+        btns.pack(pady=12)
+        chosen = {"value": None}
+
+        def ok():
+            chosen["value"] = algo_var.get()
+            dlg.destroy()
+
+        def cancel():
+            chosen["value"] = None
+            dlg.destroy()
+
+        ttk.Button(btns, text="OK", command=ok).pack(side="left", padx=6)
+        ttk.Button(btns, text="Cancel", command=cancel).pack(side="left", padx=6)
+        dlg.transient(self)
+        dlg.grab_set()
+        self.wait_window(dlg)
+        return chosen["value"]  # type: ignore
+
+    def _enable_only_restart(self) -> None:
+        for b in self._toggleable_buttons:
+            b.configure(state="disabled")
+        for r in range(9):
+            for c in range(9):
+                self.entries[r][c].configure(state="readonly", font=self.font_given, fg="black")
+
+    def _enable_all_controls(self) -> None:
+        for b in self._toggleable_buttons:
+            b.configure(state="normal")
+        for r in range(9):
+            for c in range(9):
+                if not self.given_mask[r][c]:
+                    self.entries[r][c].configure(state="normal", font=self.font_user, fg="blue")
+
+    def _set_timer_dialog(self) -> None:
+        minutes = simpledialog.askinteger("Set Timer", "Minutes:", minvalue=0, maxvalue=999, parent=self)
+        if minutes is None:
+            return
+        seconds = simpledialog.askinteger("Set Timer", "Seconds:", minvalue=0, maxvalue=59, parent=self)
+        if seconds is None:
+            return
+        total = minutes * 60 + seconds
+        self._start_timer(total)
+
+    def _start_timer(self, total_seconds: int) -> None:
+        self._stop_timer(reset_label=False)
+        self.timer_seconds_total = total_seconds
+        self.timer_seconds_left = total_seconds
+        self.timer_running = True
+        self._update_timer_label(red=False)
+        self._tick()
+
+    def _stop_timer(self, reset_label: bool = True) -> None:
+        self.timer_running = False
+        if self.timer_job is not None:
+            try:
+                self.after_cancel(self.timer_job)
+            except Exception:
+                pass
+            self.timer_job = None
+        if reset_label:
+            self.timer_label.configure(text="00:00", foreground="black")
+
+    def _tick(self) -> None:
+        if not self.timer_running:
+            return
+        self._update_timer_label(red=False)
+        if self.timer_seconds_left <= 0:
+            self.timer_running = False
+            self._on_time_up()
+            return
+        self.timer_seconds_left -= 1
+        self.timer_job = self.after(1000, self._tick)
+
+    def _update_timer_label(self, red: bool) -> None:
+        mm = self.timer_seconds_left // 60
+        ss = self.timer_seconds_left % 60
+        self.timer_label.configure(text=f"{mm:02d}:{ss:02d}",
+                                   foreground=("red" if red else "black"))
+
+    def _on_time_up(self) -> None:
+        cont = messagebox.askyesno("Time's Up", "Time is up! Continue playing? (Yes = continue, No = auto-solve)")
+        if cont:
+            self.timer_running = False
+            self.timer_seconds_left = 0
+            self._update_timer_label(red=True)
+            return
+        algo = self._ask_algorithm()
+        if not algo:
+            return
+        self._run_solver_and_render(algo, disable_after=True)
+
+    def _save_user_puzzle(self) -> None:
+        puzzle = self._get_board()
+        if all(puzzle[r][c] == 0 for r in range(9) for c in range(9)):
+            messagebox.showwarning("Empty Grid", "Enter some givens before saving as a user puzzle.")
+            return
+        text = simpledialog.askstring(
+            "Provide Solution",
+            "Enter the full 9x9 solution.\n"
+            "- Option A: 81 digits (rows concatenated)\n"
+            "- Option B: 9 lines of 9 digits\n",
+            parent=self
+        )
+        if text is None:
+            return
+        sol = self._parse_solution(text)
+        if sol is None:
+            messagebox.showerror("Invalid Solution", "Could not parse the provided solution.")
+            return
+        if not SudokuLogic.is_complete_and_valid(sol):
+            messagebox.showerror("Invalid Solution", "The provided solution is not a valid Sudoku solution.")
+            return
+        for r in range(9):
+            for c in range(9):
+                if puzzle[r][c] != 0 and puzzle[r][c] != sol[r][c]:
+                    messagebox.showerror("Mismatch", f"Given at r{r+1}c{c+1} conflicts with provided solution.")
+                    return
+        self.user_puzzles.append((puzzle, sol))
+        messagebox.showinfo("Saved", f"User puzzle saved. Total saved: {len(self.user_puzzles)}")
+        self.difficulty_var.set("User Provided")
+
+    def _parse_solution(self, text: str) -> Optional[Board]:
+        # Both accepted formats (81 digits or 9 lines of 9) reduce to "exactly
+        # 81 digits in reading order", so extract those in one pass over the
+        # encoded bytes; b - 48 avoids an int() call per character.
+        digits = bytes(b for b in text.encode() if 0x30 <= b <= 0x39)
+        if len(digits) != 81:
+            return None
+        out: Board = [[0] * 9 for _ in range(9)]
+        for k, b in enumerate(digits):
+            out[k // 9][k % 9] = b - 48
+        return out
+
+    def _verify_user_solution(self) -> None:
+        board = self._get_board()
+        text = simpledialog.askstring("Verify User Solution",
+                                      "Paste the user-provided solution here (81 digits or 9x9 lines):",
+                                      parent=self)
+        if text is None:
+            return
+        user_sol = self._parse_solution(text)
+        if user_sol is None:
+            messagebox.showerror("Invalid", "Could not parse the provided solution.")
+            return
+        if not SudokuLogic.is_complete_and_valid(user_sol):
+            messagebox.showerror("Invalid", "Provided solution is not a valid Sudoku solution.")
+            return
+
+        msg = []
+        if self.current_solution is not None:
+            # The solution for the loaded puzzle is already cached; compare
+            # against it directly and run a single solver as a doublecheck.
+            msg.append("Cached solution: available.")
+            msg.append(" - Matches provided: " + str(self.current_solution == user_sol))
+            sb = SudokuLogic.solve_backtracking_propagation(board)
+            if sb is None:
+                msg.append("Doublecheck (Backtracking+Prop): No solution found.")
+            else:
+                msg.append("Doublecheck (Backtracking+Prop): Solved.")
+                msg.append(" - Matches provided: " + str(sb == user_sol))
+        else:
+            moves_a: List[str] = []
+            moves_b: List[str] = []
+            sa = SudokuLogic.solve_bruteforce(board, moves_a)
+            sb = SudokuLogic.solve_backtracking_propagation(board, moves_b)
+            if sa is None:
+                msg.append("Brute Force: No solution found.")
+            else:
+                msg.append("Brute Force: Solved.")
+                msg.append(" - Matches provided: " + str(sa == user_sol))
+            if sb is None:
+                msg.append("Backtracking+Prop: No solution found.")
+            else:
+                msg.append("Backtracking+Prop: Solved.")
+                msg.append(" - Matches provided: " + str(sb == user_sol))
+
+        messagebox.showinfo("Verification Result", "\n".join(msg))
+
+
+if __name__ == "__main__":
+    app = SudokuApp()
+    app.mainloop()